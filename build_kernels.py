@@ -0,0 +1,22 @@
+# build_kernels.py
+# Builds the optional Cython kernels in models/_kernels.pyx
+# Build-only script (not a package setup): python build_kernels.py
+
+import sys
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    sys.exit("Cython is required to build the kernels: pip install cython")
+
+from setuptools import Extension, setup
+
+if __name__ == "__main__":
+    setup(
+        name="portfolio-risk-kernels",
+        script_args=["build_ext", "--inplace"],
+        ext_modules=cythonize(
+            [Extension("models._kernels", ["models/_kernels.pyx"])],
+            language_level=3,
+        ),
+    )
@@ -0,0 +1,2 @@
+# conftest.py
+# Lets pytest import the models/ package from the repository root
@@ -0,0 +1,29 @@
+# cython: language_level=3
+# models/_kernels.pyx
+# Cython EWMA & GBM kernels: no JIT warmup, no LLVM dependency
+# Build once with: python build_kernels.py
+
+cimport cython
+from libc.math cimport exp
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def ewma(const double[::1] r, double lamb, double var0):
+    """
+    EWMA variance via the RiskMetrics recursion, seeded with var0
+    """
+    cdef Py_ssize_t i, n = r.shape[0]
+    cdef double v = var0
+    for i in range(n):
+        v = lamb * v + (1.0 - lamb) * r[i] * r[i]
+    return v
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def gbm_terminal(const double[::1] z, double s0, double drift, double vol, double[::1] out):
+    """
+    Terminal GBM values out[i] = s0 * exp(drift + vol * z[i])
+    """
+    cdef Py_ssize_t i, n = z.shape[0]
+    for i in range(n):
+        out[i] = s0 * exp(drift + vol * z[i])
@@ -0,0 +1,24 @@
+# models/_kernels_aot.py
+# Ahead-of-time compiled EWMA & GBM kernels (numba.pycc)
+# Build once from the repository root with: python -m models._kernels_aot
+# This writes models/risk_kernels.*.so, picked up by models/ewma.py and
+# models/monte_carlo.py so no JIT warmup (or numba import) is paid at startup.
+# pycc cannot compile parallel loops: the AOT mc_terminal runs serially
+
+import os
+from numba import types
+from numba.pycc import CC
+
+from models._kernels_numba import ewma_recursion, mc_terminal
+
+cc = CC("risk_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Read-only arrays are accepted too (pandas Copy-on-Write hands those out)
+_RO_F8_1D = types.Array(types.float64, 1, "A", readonly=True)
+
+cc.export("ewma", types.float64(_RO_F8_1D, types.float64))(ewma_recursion)
+cc.export("mc_terminal", "f8[:](f8, f8, i8, i8, f8)")(mc_terminal)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,31 @@
+# models/_kernels_numba.py
+# Plain-Python EWMA & GBM kernels, compiled by Numba
+# The same functions are JIT-compiled in models/ewma.py / models/monte_carlo.py
+# and AOT-exported by models/_kernels_aot.py, so the two builds cannot drift
+
+import math
+import numpy as np
+from numba import prange
+
+def ewma_recursion(r, lamb):
+    """
+    EWMA variance via the RiskMetrics recursion
+    """
+    var = np.var(r)  # Use sample variance as starting point
+    for i in range(r.shape[0]):
+        var = lamb * var + (1.0 - lamb) * r[i] * r[i]
+    return var
+
+def mc_terminal(mu, sigma, n_days, n_sims, S0):
+    """
+    Terminal GBM values drawn directly
+    (prange runs in parallel under njit(parallel=True), serially under pycc)
+    """
+    dt = 1 / 252  # Daily time step
+    T = (n_days - 1) * dt
+    drift = (mu - 0.5 * sigma * sigma) * T
+    vol = sigma * math.sqrt(T)
+    out = np.empty(n_sims)
+    for i in prange(n_sims):
+        out[i] = S0 * math.exp(drift + vol * np.random.standard_normal())
+    return out
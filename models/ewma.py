@@ -2,8 +2,49 @@
 # Exponentially Weighted Moving Average (EWMA) Volatility
 # Based on RiskMetrics methodology
 
+import math
 import numpy as np
 
+from models.historical import _as_array
+
+try:
+    from models._kernels import ewma as _ewma_cy  # Optional: Cython build of models/_kernels.pyx
+except ImportError:
+    _ewma_cy = None
+
+try:
+    from models.risk_kernels import ewma as _ewma_aot  # Optional: AOT build (python -m models._kernels_aot)
+except ImportError:
+    _ewma_aot = None
+
+def _ewma_closed_form(r, lamb):
+    """
+    EWMA variance via the closed form of the recursion (pure NumPy)
+    """
+    # The sample-variance seed decays by lamb**n and each squared
+    # return is weighted by (1 - lamb) * lamb**(n - 1 - i)
+    n = r.size
+    w = (1.0 - lamb) * np.power(lamb, np.arange(n - 1, -1, -1))
+    return (lamb ** n) * np.var(r) + np.dot(w, r * r)
+
+if _ewma_cy is not None:
+    def _ewma_kernel(r, lamb):
+        return _ewma_cy(r, lamb, np.var(r))  # Use sample variance as starting point
+elif _ewma_aot is not None:
+    _ewma_kernel = _ewma_aot
+else:
+    # Numba (and llvmlite) is only imported when no compiled build exists
+    try:
+        import numba  # Optional: JIT-compiles the EWMA recursion
+    except ImportError:
+        numba = None
+
+    if numba is not None:
+        from models._kernels_numba import ewma_recursion
+        _ewma_kernel = numba.njit(cache=True, fastmath=True)(ewma_recursion)
+    else:
+        _ewma_kernel = _ewma_closed_form
+
 def ewma_volatility(returns, lamb=0.94, days=252):
     """
     Calculate EWMA annualized volatility
@@ -11,12 +52,8 @@ def ewma_volatility(returns, lamb=0.94, days=252):
     :param lamb: decay factor (0.94 is standard)
     :return: annualized volatility (float)
     """
-    # Initialize variance
-    var = np.var(returns)  # Use sample variance as starting point
-    
-    # Apply EWMA recursion
-    for r in returns:
-        var = lamb * var + (1 - lamb) * r**2
-    
+    arr = np.ascontiguousarray(_as_array(returns), dtype=np.float64)
+    var = _ewma_kernel(arr, lamb)
+
     # Annualize
-    return np.sqrt(var * days)
+    return math.sqrt(var * days)
@@ -1,26 +1,50 @@
 # models/historical.py
 # Historical Risk Metrics (Volatility, CVaR, etc.)
 
+import math
 import numpy as np
+import pandas as pd
+
+_SQRT252 = math.sqrt(252)  # Annualization factor for the default 252-day year
+
+def _as_array(returns):
+    # Plain ndarray view, skipping pandas' generic reduction dispatch
+    return returns.to_numpy(copy=False) if hasattr(returns, "to_numpy") else np.asarray(returns)
 
 def annualized_return(returns, days=252):
-    return np.mean(returns) * days
+    return _as_array(returns).mean() * days
 
 def annualized_volatility(returns, days=252):
-    return np.std(returns) * np.sqrt(days)
+    return _as_array(returns).std() * (_SQRT252 if days == 252 else math.sqrt(days))
 
-def sharpe_ratio(returns, rf=0.02, days=252):
-    r = annualized_return(returns, days)
-    vol = annualized_volatility(returns, days)
+def sharpe_ratio(returns, rf=0.02, days=252, ann_ret=None, ann_vol=None):
+    # Reuse precomputed annualized return/volatility when the caller has them
+    r = annualized_return(returns, days) if ann_ret is None else ann_ret
+    vol = annualized_volatility(returns, days) if ann_vol is None else ann_vol
     return (r - rf) / vol if vol != 0 else 0
 
+def _cumulative(returns):
+    # Growth of $1 in one fused pass over a float64 view
+    return np.cumprod(1.0 + np.asarray(returns, dtype=np.float64))
+
+def growth_curve(returns):
+    return pd.Series(_cumulative(returns), index=getattr(returns, "index", None))
+
 def max_drawdown(returns):
-    cumulative = (1 + returns).cumprod()
-    peak = cumulative.expanding().max()
+    cumulative = _cumulative(returns)
+    peak = np.maximum.accumulate(cumulative)  # Running peak in a single ufunc pass
     drawdown = (cumulative - peak) / peak
-    return drawdown.min()
+    return float(drawdown.min())
+
+def tail_mean(values, alpha=0.95):
+    # Average of the worst (1 - alpha) share of values: partition instead of
+    # sorting, and always keep at least the single worst observation.
+    # Empty input has no tail, so the result is nan
+    arr = _as_array(values)
+    if arr.size == 0:
+        return np.nan
+    k = max(int((1 - alpha) * arr.size), 1)
+    return np.partition(arr, k - 1)[:k].mean()
 
 def historical_cvar(returns, alpha=0.95, days=252):
-    sorted_returns = np.sort(returns)
-    index = int((1 - alpha) * len(sorted_returns))
-    return np.mean(sorted_returns[:index]) * np.sqrt(days)
+    return tail_mean(returns, alpha) * (_SQRT252 if days == 252 else math.sqrt(days))
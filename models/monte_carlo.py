@@ -2,8 +2,112 @@
 # Monte Carlo Simulation for Portfolio Risk (Geometric Brownian Motion)
 # Simulates future portfolio paths and calculates risk metrics
 
+import math
 import numpy as np
-import pandas as pd
+
+from models.historical import annualized_return, annualized_volatility
+
+try:
+    from models._kernels import gbm_terminal as _gbm_terminal_cy  # Optional: Cython build of models/_kernels.pyx
+except ImportError:
+    _gbm_terminal_cy = None
+
+try:
+    from models.risk_kernels import mc_terminal as _mc_terminal_aot  # Optional: AOT build (python -m models._kernels_aot)
+except ImportError:
+    _mc_terminal_aot = None
+
+# Shared PCG64 generator for every NumPy-side shock draw
+_RNG = np.random.default_rng()
+
+_SQRT_DT = math.sqrt(1 / 252)  # Daily shock scale for a 252-day trading year
+
+def _mc_terminal_numpy(mu, sigma, n_days, n_sims, S0):
+    """
+    Terminal GBM values drawn directly (pure NumPy)
+    """
+    dt = 1 / 252  # Daily time step
+    T = (n_days - 1) * dt
+
+    # Brownian increments are additive, so the sum of the daily shocks is a
+    # single normal draw scaled by sqrt(T): no (n_days, n_sims) matrix needed.
+    # float32 is ample for the shock arithmetic next to the Monte Carlo sampling
+    # error; the result is returned as float64 like every other backend
+    Z = _RNG.standard_normal(n_sims, dtype=np.float32)
+    drift = np.float32((mu - 0.5 * sigma * sigma) * T)
+    vol = np.float32(sigma * math.sqrt(T))
+    return (np.float32(S0) * np.exp(drift + vol * Z)).astype(np.float64)
+
+if _gbm_terminal_cy is not None:
+    def _mc_terminal(mu, sigma, n_days, n_sims, S0):
+        """
+        Terminal GBM values drawn directly (Cython update over NumPy shocks)
+        """
+        dt = 1 / 252  # Daily time step
+        T = (n_days - 1) * dt
+        Z = _RNG.standard_normal(n_sims)
+        out = np.empty(n_sims)
+        _gbm_terminal_cy(Z, S0, (mu - 0.5 * sigma * sigma) * T, sigma * math.sqrt(T), out)
+        return out
+elif _mc_terminal_aot is not None:
+    # Trade-off: the AOT build skips the numba import and JIT warmup, but pycc
+    # cannot compile parallel loops, so paths run serially (unlike the JIT kernel)
+    _mc_terminal = _mc_terminal_aot
+else:
+    # Numba (and llvmlite) is only imported when no compiled build exists
+    try:
+        import numba  # Optional: parallel JIT-compiled GBM paths
+    except ImportError:
+        numba = None
+
+    if numba is not None:
+        from models._kernels_numba import mc_terminal
+        _mc_terminal = numba.njit(parallel=True, fastmath=True, cache=True)(mc_terminal)
+    else:
+        _mc_terminal = _mc_terminal_numpy
+
+class MCEngine:
+    """
+    GBM engine for one portfolio: derives mu/sigma once and shares them
+    between the terminal-value simulation and the path plot.
+    Only mu/sigma are shared: every terminal()/paths() call draws its own shocks
+    :param returns: DataFrame of daily returns
+    :param weights: List of portfolio weights
+    :param n_days: Default time horizon (1 year = 252 days)
+    """
+
+    def __init__(self, returns, weights, n_days=252):
+        # Portfolio historical return and volatility
+        port_returns = returns.to_numpy(dtype=np.float64) @ np.asarray(weights, dtype=np.float64)
+        self.mu = float(annualized_return(port_returns))  # Annualized return
+        self.sigma = float(annualized_volatility(port_returns))  # Annualized volatility
+        self.n_days = int(n_days)
+
+    def terminal(self, n_simulations=1000, initial_portfolio=1000):
+        """
+        Final portfolio values after n_days - 1 daily steps
+        """
+        # Terminal values are drawn directly (one normal per path),
+        # so they never need a per-day shock matrix
+        return _mc_terminal(self.mu, self.sigma, self.n_days, int(n_simulations), float(initial_portfolio))
+
+    def paths(self, n_paths=100, initial_portfolio=1000, n_days=None):
+        """
+        Full (n_days + 1, n_paths) portfolio paths, starting at initial_portfolio
+        :param n_days: Time horizon (defaults to the engine's n_days)
+        """
+        n_days = self.n_days if n_days is None else int(n_days)
+        dt = 1 / 252  # Daily time step
+        half_sig2 = 0.5 * self.sigma * self.sigma
+        drift = np.float32((self.mu - half_sig2) * dt)
+        vol = np.float32(self.sigma * _SQRT_DT)
+
+        # Fresh shocks on every call, so repeated calls give independent paths
+        Z = _RNG.standard_normal((n_days, n_paths), dtype=np.float32)
+        paths = np.empty((n_days + 1, n_paths), dtype=np.float32)
+        paths[0] = initial_portfolio  # Starting value
+        paths[1:] = paths[0] * np.cumprod(np.exp(drift + vol * Z), axis=0)
+        return paths
 
 def monte_carlo_simulation(returns, weights, n_simulations=1000, n_days=252, initial_portfolio=1000):
     """
@@ -15,21 +119,4 @@ def monte_carlo_simulation(returns, weights, n_simulations=1000, n_days=252, ini
     :param initial_portfolio: Starting portfolio value
     :return: Array of final portfolio values
     """
-    # Portfolio historical return and volatility
-    port_returns = (returns * weights).sum(axis=1)
-    mu = np.mean(port_returns) * 252  # Annualized return
-    sigma = np.std(port_returns) * np.sqrt(252)  # Annualized volatility
-
-    # Generate random returns using GBM
-    dt = 1 / 252  # Daily time step
-    simulations = np.zeros((n_days, n_simulations))
-    simulations[0] = initial_portfolio
-
-    for day in range(1, n_days):
-        # Random shock
-        Z = np.random.standard_normal(n_simulations)
-        # GBM formula
-        simulations[day] = simulations[day - 1] * np.exp((mu - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * Z)
-
-    # Return final values
-    return simulations[-1, :]
+    return MCEngine(returns, weights, n_days).terminal(n_simulations, initial_portfolio)
@@ -1,14 +1,24 @@
 # models/parametric.py
 # Parametric (Gaussian) CVaR
 
+import functools
 from scipy.stats import norm
-import numpy as np
 
-def parametric_cvar(returns, alpha=0.95, days=252):
+from models.historical import annualized_return, annualized_volatility
+
+@functools.lru_cache(maxsize=32)
+def _cvar_factor(alpha):
+    """
+    Gaussian tail factor pdf(ppf(alpha)) / (1 - alpha), constant per alpha
+    """
+    return norm.pdf(norm.ppf(alpha)) / (1 - alpha)
+
+def parametric_cvar(returns, alpha=0.95, days=252, ann_ret=None, ann_vol=None):
     """
     Calculate Parametric CVaR assuming normal distribution
     """
-    mean = np.mean(returns) * days
-    std = np.std(returns) * np.sqrt(days)
-    cvar = mean - (std / (1 - alpha)) * norm.pdf(norm.ppf(alpha))
+    # Reuse precomputed annualized return/volatility when the caller has them
+    mean = annualized_return(returns, days) if ann_ret is None else ann_ret
+    std = annualized_volatility(returns, days) if ann_vol is None else ann_vol
+    cvar = mean - std * _cvar_factor(alpha)
     return cvar
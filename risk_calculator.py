@@ -2,18 +2,31 @@
 # Portfolio Risk Calculator
 # Uses models/ and outputs to figures/
 
-# Libraries used for the script: matplotlib, pandas, numpy & yfinance
-pip install yfinance pandas numpy matplotlib
+# Libraries used for the script: matplotlib, pandas, numpy, pyarrow & yfinance
+# (see README.md for the install command)
+import hashlib                               # Cache keys for downloaded data
+import multiprocessing as mp                 # Parallel weight sweeps
+import os                                    # Atomic cache writes
+from datetime import date                    # Cache keys expire daily
+from pathlib import Path                     # Cache file paths
 import yfinance as yf                        # Data from Yahoo Finance
 import pandas as pd                          # Data manipulation/analysis
 import numpy as np                           # Numerical Operations
 import matplotlib.pyplot as plt              # Plots
 
 # Import from models
-from models.historical import *                # Model 1: Historical Risk Metrics
+from models.historical import (                # Model 1: Historical Risk Metrics
+    annualized_return,
+    annualized_volatility,
+    sharpe_ratio,
+    max_drawdown,
+    historical_cvar,
+    tail_mean,
+    growth_curve,
+)
 from models.parametric import parametric_cvar  # Model 2: Parametric (Gaussian) CVaR
 from models.ewma import ewma_volatility        # Model 3: EWMA Volatility
-from models.monte_carlo import monte_carlo_simulation  # Model 4: Monte Carlo simulation (GBM)
+from models.monte_carlo import MCEngine        # Model 4: Monte Carlo simulation (GBM)
 
 # =======================
 # PORTFOLIO CONFIGURATION AND PARAMETERS
@@ -27,11 +40,34 @@ DAYS_PER_YEAR = 252                 # Trading days in a year
 # =======================
 # DOWNLOAD DATA
 # =======================
-def download_data(tickers, period="5y"):
-    """Download adjusted closing prices for tickers"""    
+def download_data(tickers, period="5y", cache_dir=".cache"):
+    """Download adjusted closing prices for tickers (cached daily as Parquet)"""
+    tickers = [tickers] if isinstance(tickers, str) else list(tickers)         # Accept a single ticker string too
+    key = hashlib.md5(f"{sorted(tickers)}|{period}|{date.today()}".encode()).hexdigest()  # One cache entry per ticker set, period & day
+    path = Path(cache_dir) / f"{key}.parquet"
+    if path.exists():
+        try:
+            returns = pd.read_parquet(path, engine="pyarrow")                   # Load cached daily returns
+            print(f"Loaded {len(returns)} days of cached data for {tickers}")
+            return returns
+        except (ImportError, OSError, ValueError) as exc:                      # pyarrow missing or unreadable file: download again
+            print(f"Ignoring unreadable cache {path}: {exc}")
+
     data = yf.download(tickers, period=period)["Adj Close"].ffill().dropna()    # Download adjusted closing prices for tickers for a y=5 period
+    if isinstance(data, pd.Series):                                             # Older yfinance returns a Series for one ticker
+        data = data.to_frame(name=tickers[0])
     returns = data.pct_change().dropna()                                        # Forward-fill & drop remaining NaNs
     print(f"Downloaded {len(returns)} days of data for {tickers}")              # Show daily returns
+    if not returns.empty and set(tickers) <= set(returns.columns):              # Only cache complete downloads (yfinance doesn't raise on failed tickers)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")                  # Write aside, then rename: never leave a truncated cache file
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            returns.to_parquet(tmp, engine="pyarrow")
+            os.replace(tmp, path)                                               # Cache for later runs today
+        except ImportError:
+            print("pyarrow is not installed: skipping the data cache")
+        finally:
+            tmp.unlink(missing_ok=True)
     return returns                                                              # Calculate daily returns
 
 # =======================
@@ -42,20 +78,62 @@ def portfolio_metrics(weights, returns, rf=0.02):
     Calculate all risk-return metrics for a portfolio
     """
     # Calculate portfolio daily returns
-    port_rets = (returns * weights).sum(axis=1)
+    port_rets = pd.Series(returns.values @ np.asarray(weights, dtype=np.float64), index=returns.index)
     
+    # Mean/std computed once, shared by every metric that needs them
+    arr = port_rets.to_numpy()
+    ann_ret = annualized_return(arr, DAYS_PER_YEAR)
+    ann_vol = annualized_volatility(arr, DAYS_PER_YEAR)
+
     # Compute metrics
     metrics = {
-        "Annualized Return": f"{annualized_return(port_rets):.2%}",
-        "Volatility": f"{annualized_volatility(port_rets):.2%}",
-        "EWMA Volatility (λ=0.94)": f"{ewma_volatility(port_rets):.2%}",
-        "Sharpe Ratio": f"{sharpe_ratio(port_rets, rf):.2f}",
+        "Annualized Return": f"{ann_ret:.2%}",
+        "Volatility": f"{ann_vol:.2%}",
+        "EWMA Volatility (λ=0.94)": f"{ewma_volatility(arr):.2%}",
+        "Sharpe Ratio": f"{sharpe_ratio(arr, rf, ann_ret=ann_ret, ann_vol=ann_vol):.2f}",
         "Max Drawdown": f"{max_drawdown(port_rets):.2%}",
-        "Historical CVaR (95%)": f"{historical_cvar(port_rets, CONFIDENCE_LEVEL):.2%}",
-        "Parametric CVaR (95%)": f"{parametric_cvar(port_rets, CONFIDENCE_LEVEL):.2%}"
+        "Historical CVaR (95%)": f"{historical_cvar(arr, CONFIDENCE_LEVEL):.2%}",
+        "Parametric CVaR (95%)": f"{parametric_cvar(arr, CONFIDENCE_LEVEL, ann_ret=ann_ret, ann_vol=ann_vol):.2%}"
     }
     return metrics, port_rets
 
+# =======================
+# WEIGHT SWEEP (PARALLEL)
+# =======================
+_SWEEP_RETURNS = None  # Per-worker returns matrix, sent once via the Pool initializer
+
+def _init_sweep_worker(returns_array):
+    global _SWEEP_RETURNS
+    _SWEEP_RETURNS = returns_array
+
+def _sweep_worker(args):
+    """
+    Numeric metrics for one weight vector against the shared returns matrix
+    (the same metric set as portfolio_metrics, unformatted)
+    """
+    weights, rf = args
+    port = _SWEEP_RETURNS @ np.asarray(weights, dtype=np.float64)
+    ann_ret = annualized_return(port, DAYS_PER_YEAR)
+    ann_vol = annualized_volatility(port, DAYS_PER_YEAR)
+    return weights, {
+        "Annualized Return": ann_ret,
+        "Volatility": ann_vol,
+        "EWMA Volatility (λ=0.94)": ewma_volatility(port),
+        "Sharpe Ratio": sharpe_ratio(port, rf, ann_ret=ann_ret, ann_vol=ann_vol),
+        "Max Drawdown": max_drawdown(port),
+        "Historical CVaR (95%)": historical_cvar(port, CONFIDENCE_LEVEL),
+        "Parametric CVaR (95%)": parametric_cvar(port, CONFIDENCE_LEVEL, ann_ret=ann_ret, ann_vol=ann_vol),
+    }
+
+def sweep(weight_list, returns, rf=0.02, processes=None):
+    """
+    Evaluate many candidate weight vectors in parallel (e.g. a grid search).
+    Returns a list of (weights, metrics) pairs in completion order.
+    """
+    # Ship the returns as a raw NumPy array, once per worker, to keep pickling cheap
+    with mp.Pool(processes, initializer=_init_sweep_worker, initargs=(returns.to_numpy(dtype=np.float64),)) as pool:
+        return list(pool.imap_unordered(_sweep_worker, [(list(w), rf) for w in weight_list]))
+
 # =======================
 # MONTE CARLO ANALYSIS
 # =======================
@@ -68,7 +146,7 @@ def analyze_monte_carlo(final_values, alpha=0.95):
     median_final = np.median(final_values)  # Median final value
     prob_loss = np.mean(final_values < 1000)  # % of paths ending below $1000
     # Simulated CVaR: average of worst 5% outcomes
-    cvar = np.mean(final_values[final_values < np.percentile(final_values, 100 * (1 - alpha))])
+    cvar = tail_mean(final_values, alpha)
     
     return {
         "Expected Final Value": f"${mean_final:,.0f}",
@@ -77,27 +155,18 @@ def analyze_monte_carlo(final_values, alpha=0.95):
         "Simulated CVaR (95%)": f"${cvar:,.0f}"
     }
 
-def plot_monte_carlo_paths(returns, weights, n_paths=100, n_days=252):
+def plot_monte_carlo_paths(returns, weights, n_paths=100, n_days=252, engine=None):
     """
     Plots a sample of 100 simulated portfolio paths over 1 year.
     Visualizes potential future outcomes.
+    :param engine: optional MCEngine to reuse its mu/sigma; when given, returns
+                   and weights are not used (the engine already holds them)
     """
-    # Portfolio historical return and volatility
-    port_rets = (returns * weights).sum(axis=1)
-    mu = np.mean(port_rets) * 252  # Annualized return
-    sigma = np.std(port_rets) * np.sqrt(252)  # Annualized volatility
-
-    # Time step (daily)
-    dt = 1 / 252
-
-    # Initialize simulation matrix
-    paths = np.zeros((n_days + 1, n_paths))
-    paths[0] = 1000  # Starting value
+    if engine is None:
+        engine = MCEngine(returns, weights, n_days)
 
     # Simulate paths using Geometric Brownian Motion
-    for day in range(1, n_days + 1):
-        Z = np.random.standard_normal(n_paths)  # Random shock
-        paths[day] = paths[day - 1] * np.exp((mu - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * Z)
+    paths = engine.paths(n_paths, initial_portfolio=1000, n_days=n_days)
 
     # Plot
     plt.figure(figsize=(10, 6))
@@ -131,11 +200,8 @@ if __name__ == "__main__":
     
     # Step 4: Run Monte Carlo Simulation
     print("\nRUNNING MONTE CARLO SIMULATION (10,000 paths, 1-year horizon)...")
-    final_values = monte_carlo_simulation(
-        returns=returns,
-        weights=print("="*60)
-    
-   WEIGHTS,
+    mc_engine = MCEngine(returns, WEIGHTS)  # Shared by the simulation and the path plot
+    final_values = mc_engine.terminal(
         n_simulations=10000,
         initial_portfolio=1000
     )
@@ -171,7 +237,7 @@ if __name__ == "__main__":
             f.write(f"| {k} | {v} |\n")
             
     # Step 7: Plot cumulative returns and save the file
-    (1 + port_rets).cumprod().plot(title="Cumulative Returns: 5-Asset Portfolio", figsize=(10, 6))
+    growth_curve(port_rets).plot(title="Cumulative Returns: 5-Asset Portfolio", figsize=(10, 6))
     plt.ylabel("Growth of $1")
     plt.xlabel("Date")
     plt.grid(True, alpha=0.3)
@@ -180,4 +246,4 @@ if __name__ == "__main__":
     plt.show()
     
     # Step 8: Plot Monte Carlo paths
-    plot_monte_carlo_paths(returns, WEIGHTS)
+    plot_monte_carlo_paths(returns, WEIGHTS, engine=mc_engine)
@@ -0,0 +1,83 @@
+# tests/test_kernels.py
+# Checks that every importable EWMA / GBM backend agrees with the NumPy reference
+# Run from the repository root with: python -m pytest -q
+
+import math
+import numpy as np
+import pandas as pd
+import pytest
+
+from models import ewma, monte_carlo
+
+LAMB = 0.94
+RETURNS = np.random.default_rng(0).normal(0.0003, 0.01, 1260)  # ~5y of daily returns
+
+def _readonly_view(arr):
+    # Mimics pandas Copy-on-Write: to_numpy() hands out a read-only view
+    view = pd.Series(arr.copy()).to_numpy().view()
+    view.flags.writeable = False
+    return view
+
+def _ewma_backends():
+    backends = {"selected": ewma._ewma_kernel}
+    if ewma._ewma_cy is not None:
+        backends["cython"] = lambda r, lamb: ewma._ewma_cy(r, lamb, np.var(r))
+    if ewma._ewma_aot is not None:
+        backends["aot"] = ewma._ewma_aot
+    try:
+        import numba
+        from models._kernels_numba import ewma_recursion
+        backends["jit"] = numba.njit(ewma_recursion)
+    except ImportError:
+        pass
+    return backends
+
+EWMA_BACKENDS = _ewma_backends()
+
+@pytest.mark.parametrize("name", sorted(EWMA_BACKENDS))
+@pytest.mark.parametrize("readonly", [False, True])
+def test_ewma_backend_matches_closed_form(name, readonly):
+    r = _readonly_view(RETURNS) if readonly else RETURNS.copy()
+    expected = ewma._ewma_closed_form(RETURNS, LAMB)
+    assert EWMA_BACKENDS[name](r, LAMB) == pytest.approx(expected, rel=1e-9)
+
+def test_ewma_volatility_accepts_readonly_series_values():
+    expected = math.sqrt(ewma._ewma_closed_form(RETURNS, LAMB) * 252)
+    assert ewma.ewma_volatility(_readonly_view(RETURNS)) == pytest.approx(expected, rel=1e-9)
+    assert ewma.ewma_volatility(pd.Series(RETURNS)) == pytest.approx(expected, rel=1e-9)
+
+def test_cython_gbm_matches_numpy():
+    if monte_carlo._gbm_terminal_cy is None:
+        pytest.skip("Cython kernels not built")
+    z = _readonly_view(RETURNS * 100)
+    out = np.empty(z.size)
+    monte_carlo._gbm_terminal_cy(z, 1000.0, 0.05, 0.15, out)
+    np.testing.assert_allclose(out, 1000.0 * np.exp(0.05 + 0.15 * z), rtol=1e-12)
+
+def _mc_backends():
+    backends = {"selected": monte_carlo._mc_terminal, "numpy": monte_carlo._mc_terminal_numpy}
+    if monte_carlo._mc_terminal_aot is not None:
+        backends["aot"] = monte_carlo._mc_terminal_aot
+    try:
+        import numba
+        from models._kernels_numba import mc_terminal
+        backends["jit"] = numba.njit(parallel=True)(mc_terminal)
+    except ImportError:
+        pass
+    return backends
+
+MC_BACKENDS = _mc_backends()
+
+@pytest.mark.parametrize("name", sorted(MC_BACKENDS))
+def test_mc_terminal_backend_distribution(name):
+    # Backends draw from different generators, so compare float64 output and
+    # the moments of log(S_T / S_0) against GBM, within sampling error
+    mu, sigma, n_days, n_sims, S0 = 0.07, 0.12, 252, 200_000, 1000.0
+    out = MC_BACKENDS[name](mu, sigma, n_days, n_sims, S0)
+    assert out.dtype == np.float64 and out.shape == (n_sims,)
+
+    T = (n_days - 1) / 252
+    log_ret = np.log(out / S0)
+    se = sigma * math.sqrt(T / n_sims)
+    assert log_ret.mean() == pytest.approx((mu - 0.5 * sigma * sigma) * T, abs=5 * se)
+    assert log_ret.std() == pytest.approx(sigma * math.sqrt(T), rel=0.01)